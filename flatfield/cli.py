@@ -4,8 +4,8 @@ import sys
 from pathlib import Path
 
 # flat-field sub-commands
-from flatfield.flatfield.compute import compute_flatfields
-from flatfield.flatfield.apply   import apply_flatfields
+from flatfield.functions.compute import compute_flatfields
+from flatfield.functions.apply   import apply_flatfields
 
 # -----------------------------------------------------------------------------
 # CLI parsing
@@ -31,6 +31,7 @@ def _build_parser() -> argparse.ArgumentParser:
     p_apply.add_argument("flatfield", type=Path, help="flatfield_manifest.json or directory containing .npy files")
     p_apply.add_argument("acq_dirs", nargs="+", type=Path, help="One or more acquisition directories to correct")
     p_apply.add_argument("--suffix", default="_ff", help="Suffix to append to corrected acquisition directory name")
+    p_apply.add_argument("--compress", action="store_true", help="Write corrected TIFFs zlib-compressed (predictor=2, level 1)")
 
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose logging")
     return parser
@@ -55,6 +56,7 @@ def main(argv: list[str] | None = None) -> None:  # noqa: D401 – simple interf
             flatfield_source=ns.flatfield,
             acq_dirs=ns.acq_dirs,
             suffix=ns.suffix,
+            compress=ns.compress,
             progress_cb=lambda a, b: logging.info("%d/%d images corrected…", a, b),
         )
     else:  # pragma: no cover – argparser enforces
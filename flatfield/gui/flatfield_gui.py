@@ -16,6 +16,7 @@ reporting.  Style constants are grouped at the top for easy tweaking.
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Callable, Optional
 import shutil
@@ -55,6 +56,64 @@ _FLASH_ERR_STYLE = (
 
 
 
+# ───────────────────────── Copy helpers ──────────────────────────────────
+def _cow_copy2(src: str, dst: str, *, follow_symlinks: bool = True) -> str:
+    """``shutil.copy2`` variant that clones via ``os.copy_file_range``.
+
+    On filesystems with copy-on-write support (btrfs/XFS, APFS) the kernel
+    turns this into a metadata-only reflink; elsewhere it degrades to an
+    in-kernel copy.  Falls back to plain ``copy2`` where unavailable.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except OSError:
+            pass  # cross-device or unsupported FS — use the generic path
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def _prepare_and_apply(
+    flatfield_source: Path,
+    acq_dirs: list[Path],
+    out_dirs: list[Path],
+    progress_cb: Callable[[int, int], None] | None = None,
+) -> Path:
+    """Copy each acquisition's aux files, then run ``apply_flatfields``.
+
+    Runs inside the worker thread so a multi-gigabyte copytree never
+    freezes the Qt event loop.
+    """
+    for acq, out_root in zip(acq_dirs, out_dirs):
+        # ① copy the *entire* acquisition tree first (skip TIFFs – they’ll be
+        #    overwritten by the corrected versions)
+        shutil.copytree(
+            acq,
+            out_root,
+            dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns("*.tif", "*.tiff", "*.tif*", "*.tiff*"),
+            copy_function=_cow_copy2,
+        )
+
+        # ② copy any JSON that lives next to the acquisition
+        for js in acq.glob("*.json"):
+            shutil.copy2(js, out_root / js.name)
+
+    return apply_flatfields(
+        flatfield_source=flatfield_source,
+        acq_dirs=acq_dirs,
+        out_dirs=out_dirs,
+        progress_cb=progress_cb,
+    )
+
+
 # ─────────────────────────── Worker wrapper ──────────────────────────────
 class _WorkerThread(QThread):
     progress = Signal(int, int)
@@ -192,7 +251,6 @@ class _ApplyTab(QWidget):
         self._try_start()
 
     # ――― Job orchestration ―――
-# ────────────────────── _ApplyTab._try_start (updated) ──────────────────────
     def _try_start(self):
         if self._worker or not (self._manifest and self._acqs):
             return
@@ -200,27 +258,14 @@ class _ApplyTab(QWidget):
         # one Downloads-folder per acquisition
         out_dirs = [DOWNLOADS / f"{acq.name}_ff" for acq in self._acqs]
 
-        for acq, out_root in zip(self._acqs, out_dirs):
-            # ① copy the *entire* acquisition tree first (skip TIFFs – they’ll be
-            #    overwritten by the corrected versions)
-            shutil.copytree(
-                acq,
-                out_root,
-                dirs_exist_ok=True,
-                ignore=shutil.ignore_patterns("*.tif", "*.tiff", "*.tif*", "*.tiff*"),
-            )
-
-            # ② copy any JSON that lives next to the acquisition
-            for js in acq.glob("*.json"):
-                shutil.copy2(js, out_root / js.name)
-
-        # hand off to the worker – it will overwrite the TIFFs in place
+        # hand everything to the worker – it copies the aux tree first, then
+        # overwrites the TIFFs with corrected versions; the GUI stays live
         self._status.setText("Applying…")
         self._prog.setRange(0, 0)
         self._prog.show()
 
         self._worker = _WorkerThread(
-            apply_flatfields,
+            _prepare_and_apply,
             flatfield_source=self._manifest,
             acq_dirs=self._acqs,
             out_dirs=out_dirs,